@@ -0,0 +1,95 @@
+"""
+Interest accrual conventions.
+A period rate only depends on the number of days in the period, so daily accrual never iterates day by day. Day counts
+for a run of monthly periods are computed in one vectorized pass and cached.
+"""
+
+from datetime import date
+from enum import StrEnum
+from functools import lru_cache
+
+import polars as pl
+from dateutil.relativedelta import relativedelta
+
+import loans_sim.constants as C
+from loans_sim.utils import get_monthly_rate
+
+
+class AccrualConvention(StrEnum):
+    # annual rate / 12 regardless of the length of the month
+    MONTHLY_SIMPLE = "monthly_simple"
+    # simple daily accrual, annual rate * days in period / 365
+    DAILY_ACTUAL_365 = "daily_actual_365"
+    # simple daily accrual, annual rate * days in period / 360
+    DAILY_ACTUAL_360 = "daily_actual_360"
+    # annual rate is an APY compounded daily, (1 + apy) ^ (days in period / 365) - 1
+    DAILY_COMPOUNDED_APY = "daily_compounded_apy"
+
+
+DAILY_CONVENTIONS = (
+    AccrualConvention.DAILY_ACTUAL_365,
+    AccrualConvention.DAILY_ACTUAL_360,
+    AccrualConvention.DAILY_COMPOUNDED_APY,
+)
+
+
+def get_daily_rate_from_apy(apy: float) -> float:
+    """
+    Daily rate that compounds to the given APY over a year
+    :param apy: An APY where the float represents a percentage e.g. pass 0.035 for 3.5%
+    :return: the daily rate
+    """
+    return (1 + apy) ** (1 / C.DAYS_IN_YEAR_ACTUAL_365) - 1
+
+
+def get_period_rate_for_days(convention: AccrualConvention, annual_rate: float, days: float) -> float:
+    match convention:
+        case AccrualConvention.MONTHLY_SIMPLE:
+            return get_monthly_rate(annual_rate)
+        case AccrualConvention.DAILY_ACTUAL_365:
+            return annual_rate * days / C.DAYS_IN_YEAR_ACTUAL_365
+        case AccrualConvention.DAILY_ACTUAL_360:
+            return annual_rate * days / C.DAYS_IN_YEAR_ACTUAL_360
+        case AccrualConvention.DAILY_COMPOUNDED_APY:
+            return (1 + get_daily_rate_from_apy(annual_rate)) ** days - 1
+    raise ValueError(f"Unsupported accrual convention {convention}")
+
+
+def get_average_monthly_period_rate(convention: AccrualConvention, annual_rate: float) -> float:
+    """Rate accrued over an average month of 365 / 12 days"""
+    return get_period_rate_for_days(convention, annual_rate, C.DAYS_IN_YEAR_ACTUAL_365 / C.MONTHS_IN_YEAR)
+
+
+def get_period_rate(convention: AccrualConvention, annual_rate: float, start: date, end: date) -> float:
+    """Rate accrued between start (inclusive) and end (exclusive)"""
+    return get_period_rate_for_days(convention, annual_rate, (end - start).days)
+
+
+@lru_cache(maxsize=1024)
+def get_monthly_period_dates(start: date, num_months: int) -> tuple[date, ...]:
+    """
+    start followed by the date at the end of each of num_months monthly periods. Matches repeatedly stepping forward
+    one month at a time like TemporalAsset.after_one_month e.g. Jan 31 -> Feb 29 -> Mar 29 rather than Mar 31
+    """
+    first_of_month = start.replace(day=1)
+    month_starts = pl.date_range(
+        first_of_month, first_of_month + relativedelta(months=num_months), interval="1mo", eager=True
+    )
+    # once the day of month is clipped by a short month it stays clipped for every month after
+    day_of_month = pl.col("Month Start").dt.month_end().dt.day().clip(upper_bound=start.day).cum_min()
+    period_dates = pl.DataFrame({"Month Start": month_starts}).select(
+        pl.col("Month Start") + pl.duration(days=day_of_month - 1)
+    )
+    return tuple(period_dates.to_series().to_list())
+
+
+@lru_cache(maxsize=1024)
+def get_monthly_period_day_counts(start: date, num_months: int) -> tuple[int, ...]:
+    """Number of days in each of the num_months monthly periods following start, see get_monthly_period_dates"""
+    period_dates = pl.Series(get_monthly_period_dates(start, num_months), dtype=pl.Date)
+    return tuple(period_dates.diff().drop_nulls().dt.total_days().to_list())
+
+
+def get_next_monthly_period_date(start: date) -> date:
+    """Date one month after start, see get_monthly_period_dates"""
+    return get_monthly_period_dates(start, 1)[-1]
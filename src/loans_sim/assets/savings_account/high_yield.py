@@ -4,10 +4,11 @@ from typing import Self
 
 from pydantic import computed_field, constr
 
+from loans_sim.accrual import AccrualConvention, get_average_monthly_period_rate, get_period_rate
 from loans_sim.assets.temporal_asset import TemporalAsset
 import loans_sim.constants as C
 from loans_sim.custom_pydantic.annotations import DollarDecimal
-from loans_sim.utils import get_monthly_rate, round_dollar_to_nearest_cent
+from loans_sim.utils import round_dollar_to_nearest_cent
 
 
 class HighYieldSavingsAccount(TemporalAsset):
@@ -15,16 +16,17 @@ class HighYieldSavingsAccount(TemporalAsset):
     vendor: constr(min_length=1)
     apy: float
     balance: DollarDecimal = C.ZERO_DOLLARS_DECIMAL
+    accrual_convention: AccrualConvention = AccrualConvention.MONTHLY_SIMPLE
 
     @computed_field
     @property
     def average_monthly_yield(self) -> float:
-        return get_monthly_rate(self.apy)
+        """Yield over an average month under the account's accrual convention"""
+        return get_average_monthly_period_rate(self.accrual_convention, self.apy)
 
     def _update_state_after_month_completed(self, new_date: date) -> Self:
-        new_balance = self.balance + round_dollar_to_nearest_cent(
-            self.balance * Decimal(str(self.average_monthly_yield))
-        )
+        period_yield = get_period_rate(self.accrual_convention, self.apy, self.as_of_date, new_date)
+        new_balance = self.balance + round_dollar_to_nearest_cent(self.balance * Decimal(str(period_yield)))
         return self.model_copy(update={"balance": new_balance})
 
     @property
@@ -1,11 +1,12 @@
 from abc import ABC, abstractmethod
 from datetime import date
-from dateutil.relativedelta import relativedelta
 from decimal import Decimal
 from typing import Self
 
 from pydantic import BaseModel
 
+from loans_sim.accrual import get_next_monthly_period_date
+
 
 class TemporalAsset(BaseModel, ABC):
     as_of_date: date
@@ -14,8 +15,12 @@ class TemporalAsset(BaseModel, ABC):
     def _update_state_after_month_completed(self, new_date: date) -> Self:
         pass
 
-    def after_one_month(self) -> Self:
-        new_date = self.as_of_date + relativedelta(months=1)
+    def after_one_month(self, new_date: date | None = None) -> Self:
+        """
+        :param new_date: the date one month after as_of_date when it is already known e.g. from a table computed by
+        get_monthly_period_dates for a whole simulation, otherwise it is looked up
+        """
+        new_date = new_date or get_next_monthly_period_date(self.as_of_date)
         updated_instance = self._update_state_after_month_completed(new_date)
         updated_instance.as_of_date = new_date
 
@@ -6,3 +6,10 @@ DOLLAR_DECIMAL_QUANTIZE_VAL = "1.00"
 ZERO_DOLLARS_DECIMAL = Decimal("0.00")
 
 MONTHS_IN_YEAR = 12
+
+# Guard against payment plans that would otherwise run (close to) forever, 50 years
+DEFAULT_MAX_PAYMENT_PLAN_MONTHS = 600
+
+# Day count conventions
+DAYS_IN_YEAR_ACTUAL_365 = 365
+DAYS_IN_YEAR_ACTUAL_360 = 360
@@ -1,12 +1,21 @@
 from collections import OrderedDict
 from dataclasses import dataclass
+from datetime import date
 from decimal import Decimal
+from itertools import pairwise
 from typing import Self
 
 import polars as pl
-from pydantic import BaseModel, constr, computed_field
+from pydantic import BaseModel, constr, computed_field, model_validator
 
 import loans_sim.constants as C
+from loans_sim.accrual import (
+    DAILY_CONVENTIONS,
+    AccrualConvention,
+    get_monthly_period_dates,
+    get_next_monthly_period_date,
+    get_period_rate,
+)
 from loans_sim.custom_pydantic.annotations import DollarDecimal
 from loans_sim.utils import get_monthly_rate, round_dollar_to_nearest_cent
 
@@ -34,6 +43,22 @@ class PaymentInfo(BaseModel):
         return self.interest_paid + self.principal_paid
 
 
+class PaymentPlanError(ValueError):
+    """A payment plan could not be computed to payoff. partial_plan holds every month that was computed"""
+
+    def __init__(self, message: str, partial_plan: pl.DataFrame):
+        super().__init__(message)
+        self.partial_plan = partial_plan
+
+
+class NonAmortizingLoanError(PaymentPlanError):
+    """The monthly payment never pays down principal so the loan can never be paid off"""
+
+
+class MaxTermExceededError(PaymentPlanError):
+    """The loan is not paid off within the maximum number of months permitted for a payment plan"""
+
+
 @dataclass(frozen=True)
 class PaymentRes:
     loan_status: "FixedRateLoan"  # forward ref to FixedRateLoan
@@ -53,7 +78,10 @@ def _make_payment_plan_info(loan: "FixedRateLoan", payment: PaymentInfo, month_n
 
 
 class FixedRateLoan(BaseModel):
-    """Simple interest assumed"""
+    """
+    Simple interest assumed. Interest accrues on principal according to accrual_convention, daily conventions require
+    as_of_date so that the number of days in each month is known. as_of_date advances a month with each accrual
+    """
 
     vendor: constr(min_length=1)
     current_amount: DollarDecimal
@@ -61,6 +89,14 @@ class FixedRateLoan(BaseModel):
     annual_interest_rate: float
     monthly_payment: DollarDecimal
     lifetime_payments: DollarDecimal = round_dollar_to_nearest_cent(0)
+    accrual_convention: AccrualConvention = AccrualConvention.MONTHLY_SIMPLE
+    as_of_date: date | None = None
+
+    @model_validator(mode="after")
+    def _check_as_of_date_for_daily_accrual(self) -> Self:
+        if self.accrual_convention in DAILY_CONVENTIONS and self.as_of_date is None:
+            raise ValueError(f"as_of_date is required for {self.accrual_convention} accrual")
+        return self
 
     @computed_field
     @property
@@ -77,13 +113,59 @@ class FixedRateLoan(BaseModel):
     def is_paid_off(self) -> bool:
         return self.current_amount == C.ZERO_DOLLARS_DECIMAL
 
-    def after_monthly_interest_accum(self) -> Self:
-        """New instance of the loan after interest is accumulated for a month"""
-        month_accum_interest = self.principal * Decimal(str(self.monthly_interest_rate))
-        month_accum_interest = round_dollar_to_nearest_cent(month_accum_interest)
+    def _get_interest_accrual(self, period_rate: float) -> Decimal:
+        return round_dollar_to_nearest_cent(self.principal * Decimal(str(period_rate)))
+
+    def get_monthly_interest_accrual(self, period_end: date | None = None) -> Decimal:
+        """
+        Interest accrued on principal over the month from as_of_date to period_end
+        :param period_end: the date one month after as_of_date when it is already known e.g. from a table computed by
+        get_monthly_period_dates for a whole payment plan, otherwise it is looked up
+        """
+        if self.accrual_convention == AccrualConvention.MONTHLY_SIMPLE:
+            return self._get_interest_accrual(self.monthly_interest_rate)
+        period_end = period_end or get_next_monthly_period_date(self.as_of_date)
+        period_rate = get_period_rate(self.accrual_convention, self.annual_interest_rate, self.as_of_date, period_end)
+        return self._get_interest_accrual(period_rate)
+
+    # use method rather than property for this as it is non-trivial computation
+    def get_annual_interest_accrual(self) -> Decimal:
+        """
+        Interest accrued on principal over the next 12 months, each month rounded to the cent as it is when accrued.
+        w monthly simple accrual this is 12 times the monthly accrual
+        """
+        if self.accrual_convention == AccrualConvention.MONTHLY_SIMPLE:
+            return C.MONTHS_IN_YEAR * self.get_monthly_interest_accrual()
+        period_dates = get_monthly_period_dates(self.as_of_date, C.MONTHS_IN_YEAR)
+        period_rates = [
+            get_period_rate(self.accrual_convention, self.annual_interest_rate, start, end)
+            for start, end in pairwise(period_dates)
+        ]
+        return sum((self._get_interest_accrual(rate) for rate in period_rates), start=C.ZERO_DOLLARS_DECIMAL)
+
+    @property
+    def is_non_amortizing(self) -> bool:
+        """
+        True if a year of monthly payments does not exceed the interest accrued over that year, in which case principal
+        is never paid down. Principal may still rise in a long month as long as it falls over the year, a loan that
+        only pays off slowly is instead caught by the max term of a payment plan
+        """
+        return not self.is_paid_off and C.MONTHS_IN_YEAR * self.monthly_payment <= self.get_annual_interest_accrual()
+
+    def after_monthly_interest_accum(self, period_end: date | None = None) -> Self:
+        """
+        New instance of the loan after interest is accumulated for a month
+        :param period_end: see get_monthly_interest_accrual
+        """
+        if self.as_of_date is not None:
+            period_end = period_end or get_next_monthly_period_date(self.as_of_date)
+        month_accum_interest = self.get_monthly_interest_accrual(period_end)
         current_amount_w_interest = self.current_amount + month_accum_interest
+        update = {"current_amount": current_amount_w_interest}
+        if self.as_of_date is not None:
+            update["as_of_date"] = period_end
 
-        return self.model_copy(update={"current_amount": current_amount_w_interest})
+        return self.model_copy(update=update)
 
     def make_payment(self, payment: Decimal) -> PaymentRes:
         payment = round_dollar_to_nearest_cent(payment)
@@ -105,16 +187,19 @@ class FixedRateLoan(BaseModel):
 
         return PaymentRes(loan_status=new_loan_state, payment_info=payment_info)
 
-    def make_monthly_payment(self) -> PaymentRes:
+    def make_monthly_payment(self, period_end: date | None = None) -> PaymentRes:
         """
         A monthly payment is a 2 step process in which
         1. The interest from the prev month is accumulated
         2. The loans monthly payment is applied to the loan with that accum interest
+        :param period_end: see get_monthly_interest_accrual
         """
-        self_with_monthly_interest = self.after_monthly_interest_accum()
+        self_with_monthly_interest = self.after_monthly_interest_accum(period_end)
         return self_with_monthly_interest.make_payment(self.monthly_payment)
 
-    def compute_payment_plan(self) -> pl.DataFrame:
+    def compute_payment_plan(
+        self, max_term_months: int = C.DEFAULT_MAX_PAYMENT_PLAN_MONTHS, allow_partial: bool = False
+    ) -> pl.DataFrame:
         """
         Generate a polars DF with all information for the Payment plan of the form
 
@@ -123,7 +208,11 @@ class FixedRateLoan(BaseModel):
         (generally few cents on $10,000 basis) that result from the payment plans generated having some months where they
         state the payment as being a certain amount, but then have monthly payment exceed this payment by a cent.
         This implementation adheres absolute fidelity to the stated monthly payment plan.
-        :param loan: the state of the loans that is to be paid off
+        :param max_term_months: the maximum number of months to compute before giving up on the loan being paid off
+        :param allow_partial: return the plan computed so far rather than raising if the loan is non-amortizing or is not
+        paid off within max_term_months
+        :raises NonAmortizingLoanError: if the loan is non-amortizing (checked before any month is computed)
+        :raises MaxTermExceededError: if the loan is not paid off within max_term_months
         :return: a DataFrame with monthly payment plan information of the form
         ┌───────┬───────────────┬──────────────┬──────────────┬──────────────┬──────────────┬──────────────┐
         │ Month ┆ Total         ┆ Principal    ┆ Interest     ┆ Cum Total    ┆ Monthly      ┆ Monthly      │
@@ -131,26 +220,41 @@ class FixedRateLoan(BaseModel):
         │  ---  ┆ ---           ┆ ---          ┆ ---          ┆ ---          ┆ Paid         ┆ Paid         │
         ╞═══════╪═══════════════╪══════════════╪══════════════╪══════════════╪══════════════╪══════════════╡
         """
+        if self.is_non_amortizing and not allow_partial:
+            raise NonAmortizingLoanError(
+                f"A year of monthly payments of {self.monthly_payment} does not exceed the annual interest accrual "
+                f"{self.get_annual_interest_accrual()} so the loan is never paid off",
+                partial_plan=pl.DataFrame(schema=PAYMENT_PLAN_SCHEMA),
+            )
+
         loan = self
         month = 1
         states = []
+        # one cached calendar for the whole term rather than looking up the end of each month as it is reached
+        period_dates = get_monthly_period_dates(self.as_of_date, max_term_months) if self.as_of_date else None
 
-        while not loan.is_paid_off:
-            payment_res = loan.make_monthly_payment()
+        while not loan.is_paid_off and month <= max_term_months:
+            payment_res = loan.make_monthly_payment(period_dates[month] if period_dates else None)
             loan, payment_made = payment_res.loan_status, payment_res.payment_info
             states.append(_make_payment_plan_info(loan, payment_made, month))
             month += 1
 
-        return pl.DataFrame(states, schema=PAYMENT_PLAN_SCHEMA)
+        payment_plan = pl.DataFrame(states, schema=PAYMENT_PLAN_SCHEMA)
+        if not loan.is_paid_off and not allow_partial:
+            raise MaxTermExceededError(
+                f"Loan is not paid off within the max term of {max_term_months} months", partial_plan=payment_plan
+            )
+        return payment_plan
 
     # use method rather than property for this as it is non-trivial computation
-    def get_remaining_total_payment_req(self) -> Decimal:
+    def get_remaining_total_payment_req(self, max_term_months: int = C.DEFAULT_MAX_PAYMENT_PLAN_MONTHS) -> Decimal:
         """
         Less efficient than amortized calculation obviously, but permits arbitrary start date calculations e.g.
         we resolve lifetime payment for a loan at any arbitrary state in terms of principal and interest rather than
         requiring that we just have initial amount (principal)
+        :raises PaymentPlanError: if the loan is not paid off within max_term_months, see compute_payment_plan
         """
-        payment_plan = self.compute_payment_plan()
+        payment_plan = self.compute_payment_plan(max_term_months=max_term_months)
         if payment_plan.is_empty():
             return C.ZERO_DOLLARS_DECIMAL
         last_total = payment_plan.select(pl.last("Cum Total Paid")).item()
@@ -0,0 +1,186 @@
+"""
+Bulk loading of fixed rate loans from CSV/Parquet.
+Constraints that FixedRateLoan enforces per instance are instead checked column-wise with polars, so a whole book can be
+validated without building a pydantic model per row.
+Only AccrualConvention.MONTHLY_SIMPLE loans are supported, a loan book has no accrual_convention or as_of_date columns.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import polars as pl
+
+import loans_sim.constants as C
+from loans_sim.liabilities.loans.fixed_rate_loan import FixedRateLoan
+
+DOLLAR_COLUMNS = ("current_amount", "principal", "monthly_payment", "lifetime_payments")
+REQUIRED_COLUMNS = ("vendor", "current_amount", "principal", "annual_interest_rate", "monthly_payment")
+
+# Decimal w more scale than a dollar amount so that a value is never rounded while it is parsed
+_PARSE_DECIMAL_DTYPE = pl.Decimal(38, 10)
+_STR_SUFFIX = "_str"
+# a non-zero digit after the cents. Checked on the str repr as parsing to a fixed scale would drop any digits past it
+_FRACTION_OF_A_CENT_PATTERN = r"\.\d{2}\d*[1-9]"
+
+LOAN_BOOK_SCHEMA = OrderedDict(
+    [
+        ("Row", pl.Int64),
+        ("vendor", pl.String),
+        ("current_amount", pl.Decimal(scale=C.DOLLAR_DECIMAL_SCALE)),
+        ("principal", pl.Decimal(scale=C.DOLLAR_DECIMAL_SCALE)),
+        ("annual_interest_rate", pl.Float64),
+        ("monthly_payment", pl.Decimal(scale=C.DOLLAR_DECIMAL_SCALE)),
+        ("lifetime_payments", pl.Decimal(scale=C.DOLLAR_DECIMAL_SCALE)),
+    ]
+)
+
+LOAN_BOOK_ERROR_SCHEMA = OrderedDict(
+    [
+        ("Row", pl.Int64),
+        ("Column", pl.String),
+        ("Error", pl.String),
+    ]
+)
+
+
+@dataclass(frozen=True)
+class LoanBookLoadRes:
+    """
+    loans holds every row that passed validation (of the form LOAN_BOOK_SCHEMA) and errors holds one entry per failed
+    check (of the form LOAN_BOOK_ERROR_SCHEMA). Row is the 0 based row number in the source in both.
+    """
+
+    loans: pl.DataFrame
+    errors: pl.DataFrame
+
+    @property
+    def is_valid(self) -> bool:
+        return self.errors.is_empty()
+
+    def to_fixed_rate_loans(self) -> list[FixedRateLoan]:
+        """Build models for the valid rows. Validation has already been done column-wise so it is skipped here"""
+        return [FixedRateLoan.model_construct(**row) for row in self.loans.drop("Row").iter_rows(named=True)]
+
+
+def _dollar_col_as_str(col: str) -> pl.Expr:
+    # mirrors round_dollar_to_nearest_cent: parse from str repr so floats are never used as the source of truth
+    return pl.col(col).cast(pl.String).str.strip_chars().alias(f"{col}{_STR_SUFFIX}")
+
+
+def _parse_dollar_col(col: str) -> pl.Expr:
+    return (
+        pl.col(f"{col}{_STR_SUFFIX}")
+        .cast(_PARSE_DECIMAL_DTYPE, strict=False)
+        .round(C.DOLLAR_DECIMAL_SCALE, mode="half_away_from_zero")
+        .cast(LOAN_BOOK_SCHEMA[col])
+        .alias(col)
+    )
+
+
+def _first_month_interest_accrual() -> pl.Expr:
+    """
+    Same as FixedRateLoan.get_monthly_interest_accrual for monthly simple accrual (the only convention a loan book
+    supports), with float rather than Decimal arithmetic
+    """
+    monthly_rate = pl.col("annual_interest_rate") / C.MONTHS_IN_YEAR
+    return (pl.col("principal").cast(pl.Float64) * monthly_rate).round(
+        C.DOLLAR_DECIMAL_SCALE, mode="half_away_from_zero"
+    )
+
+
+def _get_checks() -> list[tuple[str, pl.Expr, str]]:
+    """
+    (column, expression that is True for a valid row, error message)
+    An expression evaluating to null passes so that a value that failed to parse is only reported once
+    """
+    checks = [
+        ("vendor", pl.col("vendor").str.len_chars().fill_null(0) > 0, "vendor must be a non-empty string"),
+        (
+            "annual_interest_rate",
+            pl.col("annual_interest_rate").is_not_null() & pl.col("annual_interest_rate").is_finite(),
+            "annual_interest_rate must be a number",
+        ),
+    ]
+    for col in DOLLAR_COLUMNS:
+        checks.append((col, pl.col(col).is_not_null(), f"{col} must be a dollar amount"))
+        checks.append((col, pl.col(col) >= 0, f"{col} must be non-negative"))
+        checks.append(
+            (
+                col,
+                ~pl.col(f"{col}{_STR_SUFFIX}").str.contains(_FRACTION_OF_A_CENT_PATTERN),
+                f"{col} must not have fractions of a cent",
+            )
+        )
+    # same as FixedRateLoan.is_non_amortizing, w monthly simple accrual every month of a year accrues the same interest
+    checks.append(
+        (
+            "monthly_payment",
+            (pl.col("current_amount") == 0)
+            | (pl.col("monthly_payment").cast(pl.Float64) > _first_month_interest_accrual()),
+            "monthly_payment must exceed the first month's interest accrual or the loan is never paid off",
+        )
+    )
+    return checks
+
+
+def validate_loan_book(loan_book: pl.DataFrame) -> LoanBookLoadRes:
+    """
+    Validate and normalize a loan book
+    :param loan_book: a DataFrame with a column for each FixedRateLoan field. lifetime_payments is optional and
+    defaults to 0. Dollar amounts may be of any type that can be represented as a string e.g. str, float, decimal
+    Amounts with fractions of a cent are reported as errors rather than rounded
+    :return: the valid loans and a per row error report
+    """
+    missing_cols = [col for col in REQUIRED_COLUMNS if col not in loan_book.columns]
+    if missing_cols:
+        raise ValueError(f"Loan book is missing required columns: {missing_cols}")
+
+    if "lifetime_payments" not in loan_book.columns:
+        loan_book = loan_book.with_columns(pl.lit(C.ZERO_DOLLARS_DECIMAL).alias("lifetime_payments"))
+
+    parsed = (
+        loan_book.lazy()
+        .with_row_index("Row")
+        .select(
+            pl.col("Row").cast(pl.Int64),
+            pl.col("vendor").cast(pl.String),
+            *[_dollar_col_as_str(col) for col in DOLLAR_COLUMNS],
+            pl.col("annual_interest_rate").cast(pl.Float64, strict=False),
+        )
+        .with_columns(*[_parse_dollar_col(col) for col in DOLLAR_COLUMNS])
+    )
+    checks = _get_checks()
+    check_cols = [f"_check_{i}" for i in range(len(checks))]
+    checked = parsed.with_columns(
+        *[expr.fill_null(True).alias(check_col) for check_col, (_, expr, _) in zip(check_cols, checks)]
+    ).collect()
+
+    errors = pl.concat(
+        [
+            checked.lazy()
+            .filter(~pl.col(check_col))
+            .select("Row", pl.lit(col).alias("Column"), pl.lit(message).alias("Error"))
+            for check_col, (col, _, message) in zip(check_cols, checks)
+        ]
+    )
+    errors = errors.sort("Row", maintain_order=True).collect().cast(LOAN_BOOK_ERROR_SCHEMA)
+    loans = checked.filter(pl.all_horizontal(check_cols)).select(LOAN_BOOK_SCHEMA.keys())
+
+    return LoanBookLoadRes(loans=loans, errors=errors)
+
+
+def read_loan_book(path: str | Path) -> LoanBookLoadRes:
+    """
+    Read and validate a loan book from a .csv or .parquet file. See validate_loan_book for the expected columns.
+    Dollar amounts in a csv are read as strings so that they are never represented as floats before being parsed
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        loan_book = pl.read_csv(path, schema_overrides={col: pl.String for col in ("vendor", *DOLLAR_COLUMNS)})
+    elif suffix == ".parquet":
+        loan_book = pl.read_parquet(path)
+    else:
+        raise ValueError(f"Unsupported loan book file type {suffix}. Must be one of ['.csv', '.parquet']")
+    return validate_loan_book(loan_book)
@@ -1,5 +1,6 @@
 from decimal import Decimal
 
+import loans_sim.constants as C
 from loans_sim.liabilities.loans.fixed_rate_loan import FixedRateLoan
 from loans_sim.liabilities.mitigation_action import LiabilityMitigationAction
 from loans_sim.utils import round_dollar_to_nearest_cent
@@ -7,13 +8,20 @@ from loans_sim.utils import round_dollar_to_nearest_cent
 MAKE_ADDITIONAL_PAYMENT_ACTION_STR = "Make additional loan payment"
 
 
-def simulate_savings_from_additional_payment(loan: FixedRateLoan, payment: Decimal) -> LiabilityMitigationAction:
-    """For simplicity, assumes that extra payment made at beginning of month to avoid considering interest accum"""
+def simulate_savings_from_additional_payment(
+    loan: FixedRateLoan, payment: Decimal, max_term_months: int = C.DEFAULT_MAX_PAYMENT_PLAN_MONTHS
+) -> LiabilityMitigationAction:
+    """
+    For simplicity, assumes that extra payment made at beginning of month to avoid considering interest accum
+    :raises PaymentPlanError: if the loan is not paid off within max_term_months, see FixedRateLoan.compute_payment_plan
+    """
     payment = round_dollar_to_nearest_cent(payment)
 
-    no_action_total_payment = loan.get_remaining_total_payment_req()
+    no_action_total_payment = loan.get_remaining_total_payment_req(max_term_months=max_term_months)
     loan_after_payment = loan.make_payment(payment)
-    payment_req_after_additional_payment = loan_after_payment.loan_status.get_remaining_total_payment_req()
+    payment_req_after_additional_payment = loan_after_payment.loan_status.get_remaining_total_payment_req(
+        max_term_months=max_term_months
+    )
     total_payment_with_additional_payment = payment_req_after_additional_payment + payment
     amount_saved = no_action_total_payment - total_payment_with_additional_payment
 
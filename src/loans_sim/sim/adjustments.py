@@ -0,0 +1,218 @@
+"""
+Tax and inflation adjustments applied as polars expressions over already computed payment plans and asset time series
+so that changing assumptions never requires re-running a simulation
+"""
+
+from collections import OrderedDict
+from decimal import Decimal
+
+import polars as pl
+from pydantic import BaseModel, confloat
+
+from loans_sim.liabilities.loans.fixed_rate_loan import PAYMENT_PLAN_SCHEMA, PaymentInfo
+from loans_sim.utils import get_monthly_rate
+
+
+DEFLATOR_SCHEMA = OrderedDict(
+    [
+        ("Month", pl.Int64),
+        ("Monthly Inflation Rate", pl.Float64),
+    ]
+)
+
+ADJUSTED_PAYMENT_PLAN_SCHEMA = OrderedDict(
+    [
+        *PAYMENT_PLAN_SCHEMA.items(),
+        ("Deflator", pl.Float64),
+        ("Monthly Interest Deduction", pl.Float64),
+        ("Monthly Net Cost", pl.Float64),
+        ("Real Monthly Net Cost", pl.Float64),
+        ("Cum Real Net Cost", pl.Float64),
+    ]
+)
+
+ADJUSTED_COMPARISON_SCHEMA = OrderedDict(
+    [
+        ("Month", pl.Int64),
+        ("Date", pl.Date),
+        ("Asset Real Value", pl.Float64),
+        ("Loan Real Savings", pl.Float64),
+        ("Real Differential", pl.Float64),
+    ]
+)
+
+
+class AdjustmentAssumptions(BaseModel):
+    """
+    All rates are floats representing percentages e.g. pass 0.03 for 3%.
+    monthly_inflation_rates, when provided, takes precedence over annual_inflation_rate. It is indexed from the first
+    simulated month and the last rate is carried forward for any month past the end of the series.
+    """
+
+    annual_inflation_rate: float = 0.0
+    monthly_inflation_rates: list[float] | None = None
+    yield_tax_rate: confloat(ge=0, le=1) = 0.0
+    loan_interest_deduction_rate: confloat(ge=0, le=1) = 0.0
+
+
+def make_deflator_frame(assumptions: AdjustmentAssumptions, num_months: int) -> pl.DataFrame:
+    """
+    Cumulative price level for months 0..num_months where month 0 (today) always has a deflator of 1.
+    Dividing a nominal amount paid/held at month m by its deflator gives the amount in today's dollars.
+    """
+    rates = assumptions.monthly_inflation_rates or [get_monthly_rate(assumptions.annual_inflation_rate)]
+    month_rates = rates[:num_months] + [rates[-1]] * max(0, num_months - len(rates))
+    return pl.DataFrame(
+        {"Month": range(num_months + 1), "Monthly Inflation Rate": [0.0, *month_rates]},
+        schema=DEFLATOR_SCHEMA,
+    ).with_columns((1 + pl.col("Monthly Inflation Rate")).cum_prod().alias("Deflator"))
+
+
+def adjust_payment_plan(payment_plan: pl.DataFrame, assumptions: AdjustmentAssumptions) -> pl.DataFrame:
+    """
+    Extend a payment plan with after-deduction and inflation adjusted cost columns
+    :param payment_plan: a DataFrame of the form produced by FixedRateLoan.compute_payment_plan
+    :param assumptions: the tax/inflation assumptions to apply
+    :return: the payment plan with the additional columns of ADJUSTED_PAYMENT_PLAN_SCHEMA
+    """
+    deflators = make_deflator_frame(assumptions, payment_plan.height).select("Month", "Deflator")
+    interest_paid = pl.col("Monthly Interest Paid").cast(pl.Float64)
+    total_paid = pl.col("Monthly Principal Paid").cast(pl.Float64) + interest_paid
+
+    return (
+        payment_plan.lazy()
+        .join(deflators.lazy(), on="Month", how="left")
+        .with_columns((interest_paid * assumptions.loan_interest_deduction_rate).alias("Monthly Interest Deduction"))
+        .with_columns((total_paid - pl.col("Monthly Interest Deduction")).alias("Monthly Net Cost"))
+        .with_columns((pl.col("Monthly Net Cost") / pl.col("Deflator")).alias("Real Monthly Net Cost"))
+        .with_columns(pl.col("Real Monthly Net Cost").cum_sum().alias("Cum Real Net Cost"))
+        .select(ADJUSTED_PAYMENT_PLAN_SCHEMA.keys())
+        .collect()
+    )
+
+
+def adjust_asset_time_series(
+    asset_time_series: pl.DataFrame, principal: Decimal, assumptions: AdjustmentAssumptions
+) -> pl.DataFrame:
+    """
+    Tax the accumulated yield and express the resulting gain in today's dollars.
+    Inflation erodes the principal that was set aside as well as the yield, so the real gain at month m is
+    (principal + after tax gain) / deflator - principal
+    :param asset_time_series: a DataFrame of the form produced by AccumTimeSeries.to_frame
+    :param principal: the amount of capital initially allocated to the asset
+    :param assumptions: the tax/inflation assumptions to apply
+    :return: the time series with After Tax Value and Real Value columns added
+    """
+    deflators = make_deflator_frame(assumptions, asset_time_series.height).select("Month", "Deflator")
+    principal = float(principal)
+
+    return (
+        asset_time_series.lazy()
+        .join(deflators.lazy(), on="Month", how="left")
+        .with_columns((pl.col("Value").cast(pl.Float64) * (1 - assumptions.yield_tax_rate)).alias("After Tax Value"))
+        .with_columns(((principal + pl.col("After Tax Value")) / pl.col("Deflator") - principal).alias("Real Value"))
+        .collect()
+    )
+
+
+def make_real_loan_savings_frame(
+    baseline_plan: pl.DataFrame,
+    paydown_plan: pl.DataFrame,
+    upfront_payment: PaymentInfo,
+    assumptions: AdjustmentAssumptions,
+    num_months: int | None = None,
+) -> pl.DataFrame:
+    """
+    Real savings from making an upfront payment on a loan, by month.
+    Savings at month m are the cumulative difference in real net cost between the baseline plan and the plan after the
+    upfront payment (with the after-deduction upfront payment itself as a cost at month 0) plus the real difference in
+    outstanding balance at month m, which is the debt the upfront payment has already retired. With nominal
+    assumptions savings start at 0 at month 0 and end at the lifetime amount saved computed by
+    simulate_savings_from_additional_payment once both plans have been paid off.
+    :param baseline_plan: the payment plan if no additional payment is made
+    :param paydown_plan: the payment plan of the loan state after the upfront payment has been made
+    :param upfront_payment: the payment info of the upfront payment e.g. FixedRateLoan.make_payment(...).payment_info
+    :param assumptions: the tax/inflation assumptions to apply
+    :param num_months: horizon to report over, defaults to the length of the longer plan. Savings are held constant
+    after both plans have been paid off
+    :return: a DataFrame with columns Month and Loan Real Savings
+    """
+    return make_real_loan_savings_frame_from_adjusted(
+        adjust_payment_plan(baseline_plan, assumptions),
+        adjust_payment_plan(paydown_plan, assumptions),
+        upfront_payment,
+        assumptions,
+        num_months=num_months,
+    )
+
+
+def make_real_loan_savings_frame_from_adjusted(
+    adjusted_baseline_plan: pl.DataFrame,
+    adjusted_paydown_plan: pl.DataFrame,
+    upfront_payment: PaymentInfo,
+    assumptions: AdjustmentAssumptions,
+    num_months: int | None = None,
+) -> pl.DataFrame:
+    """
+    Same as make_real_loan_savings_frame for plans that have already been through adjust_payment_plan with the same
+    assumptions, so that a plan shared by many comparisons is only adjusted once
+    """
+    num_months = (
+        num_months if num_months is not None else max(adjusted_baseline_plan.height, adjusted_paydown_plan.height)
+    )
+    horizon = max(num_months, adjusted_baseline_plan.height, adjusted_paydown_plan.height)
+    upfront_net_cost = float(upfront_payment.total_paid) - (
+        float(upfront_payment.interest_paid) * assumptions.loan_interest_deduction_rate
+    )
+
+    def _real_costs(adjusted: pl.DataFrame, alias: str) -> pl.LazyFrame:
+        return adjusted.lazy().select(
+            "Month",
+            pl.col("Real Monthly Net Cost").alias(f"{alias} Cost"),
+            (pl.col("Total Remaining").cast(pl.Float64) / pl.col("Deflator")).alias(f"{alias} Remaining"),
+        )
+
+    # months after a plan has been paid off have nothing paid and nothing remaining
+    cost_delta = pl.col("Baseline Cost").fill_null(0.0) - pl.col("Paydown Cost").fill_null(0.0)
+    remaining_delta = pl.col("Baseline Remaining").fill_null(0.0) - pl.col("Paydown Remaining").fill_null(0.0)
+    is_upfront_month = pl.col("Month") == 0
+
+    return (
+        pl.LazyFrame({"Month": range(horizon + 1)}, schema={"Month": pl.Int64})
+        .join(_real_costs(adjusted_baseline_plan, "Baseline"), on="Month", how="left")
+        .join(_real_costs(adjusted_paydown_plan, "Paydown"), on="Month", how="left")
+        .with_columns(
+            (
+                pl.when(is_upfront_month).then(pl.lit(-upfront_net_cost)).otherwise(cost_delta).cum_sum()
+                + pl.when(is_upfront_month).then(pl.lit(float(upfront_payment.total_paid))).otherwise(remaining_delta)
+            ).alias("Loan Real Savings")
+        )
+        .filter(pl.col("Month") <= num_months)
+        .select("Month", "Loan Real Savings")
+        .collect()
+    )
+
+
+def make_adjusted_comparison_frame(
+    asset_time_series: pl.DataFrame,
+    principal: Decimal,
+    baseline_plan: pl.DataFrame,
+    paydown_plan: pl.DataFrame,
+    upfront_payment: PaymentInfo,
+    assumptions: AdjustmentAssumptions,
+) -> pl.DataFrame:
+    """
+    Month by month comparison, in today's after-tax dollars, of allocating principal to an asset vs paying down a loan
+    with it. A positive Real Differential means the asset is ahead at that month.
+    """
+    asset = adjust_asset_time_series(asset_time_series, principal, assumptions).select(
+        "Month", "Date", pl.col("Real Value").alias("Asset Real Value")
+    )
+    loan = make_real_loan_savings_frame(
+        baseline_plan, paydown_plan, upfront_payment, assumptions, num_months=asset_time_series.height - 1
+    )
+    return (
+        asset.join(loan, on="Month", how="left")
+        .with_columns((pl.col("Asset Real Value") - pl.col("Loan Real Savings")).alias("Real Differential"))
+        .select(ADJUSTED_COMPARISON_SCHEMA.keys())
+    )
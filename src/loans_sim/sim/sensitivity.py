@@ -0,0 +1,299 @@
+"""
+Sensitivity (tornado) analysis of the decision between allocating capital to a savings account vs paying down a loan.
+Every perturbation of a base scenario is evaluated at a shared horizon. Payment plans, their adjustments and asset time
+series are computed once per distinct set of inputs and shared by every scenario that uses them.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from decimal import Decimal
+
+import polars as pl
+from pydantic import BaseModel, Field
+
+from loans_sim.assets.savings_account.high_yield import HighYieldSavingsAccount
+from loans_sim.custom_pydantic.annotations import DollarDecimal
+from loans_sim.liabilities.loans.fixed_rate_loan import FixedRateLoan, PaymentInfo, PaymentPlanError
+from loans_sim.sim.adjustments import (
+    AdjustmentAssumptions,
+    adjust_asset_time_series,
+    adjust_payment_plan,
+    make_real_loan_savings_frame_from_adjusted,
+)
+from loans_sim.sim.time_series import make_temporal_asset_time_series
+from loans_sim.utils import round_dollar_to_nearest_cent
+
+LOAN_PARAMETERS = ("annual_interest_rate", "monthly_payment")
+ASSET_PARAMETERS = ("apy",)
+CAPITAL_PARAMETER = "capital"
+SENSITIVITY_PARAMETERS = (*LOAN_PARAMETERS, *ASSET_PARAMETERS, CAPITAL_PARAMETER)
+DOLLAR_PARAMETERS = ("monthly_payment", CAPITAL_PARAMETER)
+
+INVEST_DECISION_STR = "Invest in savings account"
+PAY_DOWN_LOAN_DECISION_STR = "Pay down loan"
+
+SCENARIO_OUTCOMES_SCHEMA = OrderedDict(
+    [
+        ("Parameter", pl.String),
+        ("Direction", pl.String),
+        ("Value", pl.Float64),
+        ("Real Differential", pl.Float64),
+        ("Error", pl.String),
+    ]
+)
+
+IMPACT_SCHEMA = OrderedDict(
+    [
+        ("Parameter", pl.String),
+        ("Base Value", pl.Float64),
+        ("Low Value", pl.Float64),
+        ("High Value", pl.Float64),
+        ("Low Differential", pl.Float64),
+        ("High Differential", pl.Float64),
+        ("Swing", pl.Float64),
+        ("Elasticity", pl.Float64),
+        ("Low Decision", pl.String),
+        ("High Decision", pl.String),
+        ("Decision Changes", pl.Boolean),
+    ]
+)
+
+
+class SensitivityScenario(BaseModel):
+    """
+    The base case where capital is either put in the savings account or paid against the loan today.
+    The balance of savings_account is ignored and replaced by capital.
+    """
+
+    loan: FixedRateLoan
+    savings_account: HighYieldSavingsAccount
+    capital: DollarDecimal
+    # minimum horizon, scenarios are always evaluated through to the payoff of every baseline loan in the analysis
+    num_months: int = Field(default=12, ge=1)
+    assumptions: AdjustmentAssumptions = AdjustmentAssumptions()
+
+    def get_param(self, name: str) -> float | Decimal:
+        if name in LOAN_PARAMETERS:
+            return getattr(self.loan, name)
+        if name in ASSET_PARAMETERS:
+            return getattr(self.savings_account, name)
+        if name == CAPITAL_PARAMETER:
+            return self.capital
+        raise ValueError(f"Unknown sensitivity parameter {name}. Must be one of {SENSITIVITY_PARAMETERS}")
+
+    def with_param(self, name: str, value: float | Decimal) -> "SensitivityScenario":
+        if name in DOLLAR_PARAMETERS:
+            value = round_dollar_to_nearest_cent(value)
+        if name in LOAN_PARAMETERS:
+            return self.model_copy(update={"loan": self.loan.model_copy(update={name: value})})
+        if name in ASSET_PARAMETERS:
+            return self.model_copy(update={"savings_account": self.savings_account.model_copy(update={name: value})})
+        if name == CAPITAL_PARAMETER:
+            return self.model_copy(update={"capital": value})
+        raise ValueError(f"Unknown sensitivity parameter {name}. Must be one of {SENSITIVITY_PARAMETERS}")
+
+
+@dataclass(frozen=True)
+class SensitivityRes:
+    base_differential: float
+    scenario_outcomes: pl.DataFrame
+    impact: pl.DataFrame
+
+
+def get_decision(real_differential: float) -> str:
+    return INVEST_DECISION_STR if real_differential > 0 else PAY_DOWN_LOAN_DECISION_STR
+
+
+def _decision_expr(differential_col: str) -> pl.Expr:
+    """Decision for a differential column, null where the scenario could not be evaluated"""
+    return (
+        pl.when(pl.col(differential_col) > 0)
+        .then(pl.lit(INVEST_DECISION_STR))
+        .when(pl.col(differential_col) <= 0)
+        .then(pl.lit(PAY_DOWN_LOAN_DECISION_STR))
+    )
+
+
+class _ScenarioBatchEvaluator:
+    """
+    Evaluates scenarios that share adjustment assumptions, reusing everything already computed for other scenarios
+    e.g. an apy perturbation reuses the base adjusted payment plans and loan real savings while a loan rate
+    perturbation reuses the base asset real value
+    """
+
+    def __init__(self, assumptions: AdjustmentAssumptions) -> None:
+        self._assumptions = assumptions
+        self._adjusted_baseline_plans: dict[tuple, pl.DataFrame] = {}
+        self._adjusted_paydowns: dict[tuple, tuple[pl.DataFrame, PaymentInfo]] = {}
+        self._loan_real_savings: dict[tuple, float] = {}
+        self._asset_real_values: dict[tuple, float] = {}
+
+    @staticmethod
+    def _loan_key(loan: FixedRateLoan) -> tuple:
+        return (
+            loan.current_amount,
+            loan.principal,
+            loan.annual_interest_rate,
+            loan.monthly_payment,
+            loan.accrual_convention,
+            loan.as_of_date,
+        )
+
+    def _adjusted_baseline_plan(self, loan: FixedRateLoan) -> pl.DataFrame:
+        key = self._loan_key(loan)
+        if key not in self._adjusted_baseline_plans:
+            self._adjusted_baseline_plans[key] = adjust_payment_plan(loan.compute_payment_plan(), self._assumptions)
+        return self._adjusted_baseline_plans[key]
+
+    def _adjusted_paydown(self, loan: FixedRateLoan, capital: Decimal) -> tuple[pl.DataFrame, PaymentInfo]:
+        key = (*self._loan_key(loan), capital)
+        if key not in self._adjusted_paydowns:
+            payment_res = loan.make_payment(capital)
+            adjusted_plan = adjust_payment_plan(payment_res.loan_status.compute_payment_plan(), self._assumptions)
+            self._adjusted_paydowns[key] = adjusted_plan, payment_res.payment_info
+        return self._adjusted_paydowns[key]
+
+    def get_baseline_payoff_months(self, scenario: SensitivityScenario) -> int:
+        """:raises PaymentPlanError: if the scenario's loan can not be paid off"""
+        return self._adjusted_baseline_plan(scenario.loan).height
+
+    def _get_loan_real_savings(self, scenario: SensitivityScenario, horizon: int) -> float:
+        key = (*self._loan_key(scenario.loan), scenario.capital, horizon)
+        if key not in self._loan_real_savings:
+            adjusted_paydown_plan, upfront_payment = self._adjusted_paydown(scenario.loan, scenario.capital)
+            savings = make_real_loan_savings_frame_from_adjusted(
+                self._adjusted_baseline_plan(scenario.loan),
+                adjusted_paydown_plan,
+                upfront_payment,
+                self._assumptions,
+                num_months=horizon,
+            )
+            self._loan_real_savings[key] = savings.select(pl.last("Loan Real Savings")).item()
+        return self._loan_real_savings[key]
+
+    def _get_asset_real_value(self, scenario: SensitivityScenario, horizon: int) -> float:
+        account = scenario.savings_account.model_copy(update={"balance": scenario.capital})
+        key = (account.as_of_date, account.apy, account.balance, account.accrual_convention, horizon)
+        if key not in self._asset_real_values:
+            asset_time_series = make_temporal_asset_time_series(account, horizon).to_frame()
+            adjusted = adjust_asset_time_series(asset_time_series, scenario.capital, self._assumptions)
+            self._asset_real_values[key] = adjusted.select(pl.last("Real Value")).item()
+        return self._asset_real_values[key]
+
+    def evaluate(self, scenario: SensitivityScenario, horizon: int) -> float:
+        """
+        Real Differential at month horizon
+        :raises PaymentPlanError: if the scenario's loan can not be paid off
+        """
+        return self._get_asset_real_value(scenario, horizon) - self._get_loan_real_savings(scenario, horizon)
+
+
+def _make_perturbed_scenarios(
+    scenario: SensitivityScenario, param_ranges: dict[str, tuple[float, float]]
+) -> list[tuple[str, str, float | Decimal, SensitivityScenario]]:
+    """(parameter, direction, value, scenario) for every perturbation. Rejects ranges that give a negative value"""
+    perturbed = []
+    for name, (low_offset, high_offset) in param_ranges.items():
+        base_value = scenario.get_param(name)
+        for direction, offset in (("Low", low_offset), ("High", high_offset)):
+            value = base_value + type(base_value)(str(offset))
+            if value < 0:
+                raise ValueError(f"{direction} offset {offset} for {name} gives a negative value {value}")
+            perturbed.append((name, direction, value, scenario.with_param(name, value)))
+    return perturbed
+
+
+def run_sensitivity_analysis(
+    scenario: SensitivityScenario, param_ranges: dict[str, tuple[float, float]]
+) -> SensitivityRes:
+    """
+    Perturb each parameter of a base scenario to the low and high end of its range and measure the Real Differential
+    (savings account real value - loan real savings) for each. All scenarios are measured at the same horizon, the
+    longer of scenario.num_months and the longest baseline payoff of any scenario, so the full lifetime savings of
+    paying down the loan are always counted.
+    :param scenario: the base scenario
+    :param param_ranges: parameter name to (low offset, high offset) from the base value e.g. {"apy": (-0.005, 0.005)}
+    for the apy moving +/- 0.5%. Parameters must be in SENSITIVITY_PARAMETERS
+    :raises ValueError: if a parameter is unknown or an offset gives a negative value
+    :raises PaymentPlanError: if the base scenario's loan can not be paid off. A perturbed scenario whose loan can not
+    be paid off instead has a null Real Differential and the reason in Error
+    :return: the base differential, the differential for every perturbed scenario and an impact table ranked by the
+    swing in differential across each parameter's range. Elasticity is the central difference estimate of
+    % change in differential / % change in parameter and is null where either base value is zero
+    """
+    perturbed = _make_perturbed_scenarios(scenario, param_ranges)
+    evaluator = _ScenarioBatchEvaluator(scenario.assumptions)
+
+    # payment plans for every scenario up front to find the shared horizon
+    errors: dict[int, str] = {}
+    payoff_months = [evaluator.get_baseline_payoff_months(scenario)]
+    for i, (_, _, _, perturbed_scenario) in enumerate(perturbed):
+        try:
+            payoff_months.append(evaluator.get_baseline_payoff_months(perturbed_scenario))
+        except PaymentPlanError as e:
+            errors[i] = str(e)
+    horizon = max(scenario.num_months, *payoff_months)
+
+    base_differential = evaluator.evaluate(scenario, horizon)
+    outcomes = []
+    for i, (name, direction, value, perturbed_scenario) in enumerate(perturbed):
+        differential = None
+        if i not in errors:
+            try:
+                differential = evaluator.evaluate(perturbed_scenario, horizon)
+            except PaymentPlanError as e:
+                errors[i] = str(e)
+        outcomes.append(
+            {
+                "Parameter": name,
+                "Direction": direction,
+                "Value": float(value),
+                "Real Differential": differential,
+                "Error": errors.get(i),
+            }
+        )
+    scenario_outcomes = pl.DataFrame(outcomes, schema=SCENARIO_OUTCOMES_SCHEMA)
+    if scenario_outcomes.is_empty():
+        empty_impact = pl.DataFrame(schema=IMPACT_SCHEMA)
+        return SensitivityRes(base_differential, scenario_outcomes=scenario_outcomes, impact=empty_impact)
+
+    base_values = pl.DataFrame(
+        {"Parameter": list(param_ranges), "Base Value": [float(scenario.get_param(name)) for name in param_ranges]},
+        schema={"Parameter": pl.String, "Base Value": pl.Float64},
+    )
+    param_change = (pl.col("High Value") - pl.col("Low Value")) / pl.col("Base Value")
+    differential_change = (pl.col("High Differential") - pl.col("Low Differential")) / base_differential
+    base_decision = get_decision(base_differential)
+
+    impact = (
+        scenario_outcomes.pivot(on="Direction", index="Parameter", values=["Value", "Real Differential"])
+        .rename(
+            {
+                "Value_Low": "Low Value",
+                "Value_High": "High Value",
+                "Real Differential_Low": "Low Differential",
+                "Real Differential_High": "High Differential",
+            }
+        )
+        .join(base_values, on="Parameter", how="left")
+        .with_columns(
+            (pl.col("High Differential") - pl.col("Low Differential")).abs().alias("Swing"),
+            pl.when((pl.col("Base Value") != 0) & (param_change != 0) & pl.lit(base_differential != 0))
+            .then(differential_change / param_change)
+            .otherwise(None)
+            .alias("Elasticity"),
+            _decision_expr("Low Differential").alias("Low Decision"),
+            _decision_expr("High Differential").alias("High Decision"),
+        )
+        .with_columns(
+            # a side that could not be evaluated has no decision, so only the evaluated side(s) can change it
+            (
+                (pl.col("Low Decision") != base_decision).fill_null(False)
+                | (pl.col("High Decision") != base_decision).fill_null(False)
+            ).alias("Decision Changes")
+        )
+        .sort("Swing", descending=True, nulls_last=True)
+        .select(IMPACT_SCHEMA.keys())
+    )
+
+    return SensitivityRes(base_differential=base_differential, scenario_outcomes=scenario_outcomes, impact=impact)
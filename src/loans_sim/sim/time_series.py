@@ -0,0 +1,86 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date
+from dateutil.relativedelta import relativedelta
+from decimal import Decimal
+
+import polars as pl
+
+from loans_sim.accrual import get_monthly_period_dates
+from loans_sim.assets.temporal_asset import TemporalAsset
+
+
+ACCUM_TIME_SERIES_SCHEMA = OrderedDict(
+    [
+        ("Month", pl.Int64),
+        ("Date", pl.Date),
+        ("Value", pl.Decimal(scale=2)),
+    ]
+)
+
+
+@dataclass(frozen=True)
+class AccumTimeSeries:
+    label: str
+    time_points: list[date]
+    value_points: list[Decimal]
+
+    def to_frame(self) -> pl.DataFrame:
+        """Columnar view of the series where Month is the number of months elapsed since the first time point"""
+        return pl.DataFrame(
+            {
+                "Month": range(len(self.time_points)),
+                "Date": self.time_points,
+                "Value": self.value_points,
+            },
+            schema=ACCUM_TIME_SERIES_SCHEMA,
+        )
+
+
+@dataclass
+class TimeSeriesAccumulator:
+    time_points: list[date] = field(default_factory=list)
+    value_points: list[Decimal] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if len(self.time_points) != len(self.value_points):
+            raise ValueError("The length of time points and value points do not match")
+
+    def _is_valid_next_time_point(self, time_point: date) -> bool:
+        if not self.time_points:
+            return True
+        # right now assume we always have one month progressions
+        return self.time_points[-1] + relativedelta(months=1) == time_point
+
+    def add_point(self, time_point: date, value_point: Decimal) -> None:
+        if not self._is_valid_next_time_point(time_point):
+            # always have -1 bc we have a laste time point to check for validity here
+            raise ValueError(
+                f"Next time point {time_point} is not valid. Must be exactly one month after {self.time_points[-1]}"
+            )
+        self.time_points.append(time_point)
+        self.value_points.append(value_point)
+
+    def collect(self, label: str) -> AccumTimeSeries:
+        return AccumTimeSeries(label, self.time_points, self.value_points)
+
+
+def make_temporal_asset_time_series(asset: TemporalAsset, num_months: int = 12, label: str = None) -> AccumTimeSeries:
+    label = label or str(asset)
+    ts_accumulator = TimeSeriesAccumulator()
+    original_val = asset.total_value
+    period_dates = get_monthly_period_dates(asset.as_of_date, num_months + 1)
+
+    # the first point is start value
+    for new_date in period_dates[1:]:
+        ts_accumulator.add_point(asset.as_of_date, asset.total_value - original_val)
+        asset = asset.after_one_month(new_date)
+    return ts_accumulator.collect(label=label)
+
+
+def make_const_ts_for_time_points(time_points: list[date], const_val: Decimal, label: str) -> AccumTimeSeries:
+    return AccumTimeSeries(
+        label=label,
+        time_points=time_points,
+        value_points=[const_val for _ in range(len(time_points))],
+    )
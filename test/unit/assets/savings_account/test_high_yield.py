@@ -1,7 +1,10 @@
 from datetime import date
 from decimal import Decimal
 
+import pytest
+
 import loans_sim.constants as C
+from loans_sim.accrual import AccrualConvention
 from loans_sim.assets.savings_account.high_yield import HighYieldSavingsAccount
 
 
@@ -16,6 +19,25 @@ def test_average_monthly_yield():
     assert savings_account.total_value == 0
 
 
+@pytest.mark.parametrize(
+    "convention, expected",
+    [
+        (AccrualConvention.DAILY_ACTUAL_365, 0.01),
+        (AccrualConvention.DAILY_ACTUAL_360, 0.12 * 365 / 360 / 12),
+        (AccrualConvention.DAILY_COMPOUNDED_APY, 1.12 ** (1 / 12) - 1),
+    ],
+)
+def test_average_monthly_yield_daily_accrual(convention: AccrualConvention, expected: float):
+    savings_account = HighYieldSavingsAccount(
+        as_of_date=date(2020, 1, 1),
+        vendor="test",
+        apy=0.12,
+        accrual_convention=convention,
+    )
+
+    assert savings_account.average_monthly_yield == pytest.approx(expected)
+
+
 def test_high_yield_savings_account_advanced_after_one_month_zero_stays_zero():
     savings_account = HighYieldSavingsAccount(
         as_of_date=date(2020, 1, 1),
@@ -38,3 +60,19 @@ def test_high_yield_savings_account_advanced_after_one_month_simple_one_percent(
 
     assert after_one_month is not savings_account  # new instance
     assert after_one_month.balance == Decimal("101.00")
+
+
+def test_high_yield_savings_account_advanced_after_one_month_daily_compounded_apy():
+    savings_account = HighYieldSavingsAccount(
+        as_of_date=date(2021, 2, 1),
+        vendor="test",
+        apy=0.12,
+        balance=Decimal("10000.00"),
+        accrual_convention=AccrualConvention.DAILY_COMPOUNDED_APY,
+    )
+
+    after_one_month = savings_account.after_one_month()
+
+    # 28 days in Feb 2021 => 10000 * (1.12 ^ (28 / 365) - 1) = 87.32
+    assert after_one_month.as_of_date == date(2021, 3, 1)
+    assert after_one_month.balance == Decimal("10087.32")
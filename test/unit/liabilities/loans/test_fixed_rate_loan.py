@@ -4,6 +4,7 @@
 #   should come back and make explicit make_payment tests (being tested implicitly via make_monthly_payment
 #   which would have all cases)
 import copy
+from datetime import date
 from decimal import Decimal
 
 import polars as pl
@@ -11,7 +12,13 @@ import polars.testing as plt
 import pytest
 
 import loans_sim.constants as C
-from loans_sim.liabilities.loans.fixed_rate_loan import FixedRateLoan, PAYMENT_PLAN_SCHEMA
+from loans_sim.accrual import AccrualConvention
+from loans_sim.liabilities.loans.fixed_rate_loan import (
+    FixedRateLoan,
+    MaxTermExceededError,
+    NonAmortizingLoanError,
+    PAYMENT_PLAN_SCHEMA,
+)
 
 
 def test_interest_computed_correctly():
@@ -273,3 +280,161 @@ def test_get_total_payment_req_n_month_payoff():
     # 50 + 50 + 32.13 = 132.13 total
 
     assert loan_in_state_to_be_paid_off_in_n_months.get_remaining_total_payment_req() == Decimal("132.13")
+
+
+@pytest.mark.parametrize("monthly_payment", ["0.99", "1.00"], ids=["below_accrual", "equal_to_accrual"])
+def test_is_non_amortizing(monthly_payment: str):
+    loan = FixedRateLoan(
+        vendor="TestBank",
+        current_amount=Decimal("130.00"),
+        principal=Decimal("100.00"),
+        annual_interest_rate=0.12,
+        monthly_payment=Decimal(monthly_payment),
+    )
+
+    assert loan.get_annual_interest_accrual() == Decimal("12.00")
+    assert loan.is_non_amortizing
+
+
+def test_is_non_amortizing_false_for_paid_off_loan():
+    loan = FixedRateLoan(
+        vendor="TestBank",
+        current_amount=Decimal("0.00"),
+        principal=Decimal("0.00"),
+        annual_interest_rate=0.12,
+        monthly_payment=Decimal("0.00"),
+    )
+
+    assert not loan.is_non_amortizing
+
+
+def test_compute_payment_plan_non_amortizing_raises():
+    loan = FixedRateLoan(
+        vendor="TestBank",
+        current_amount=Decimal("130.00"),
+        principal=Decimal("100.00"),
+        annual_interest_rate=0.12,
+        monthly_payment=Decimal("1.00"),
+    )
+
+    with pytest.raises(NonAmortizingLoanError) as exc_info:
+        loan.compute_payment_plan()
+
+    assert exc_info.value.partial_plan.is_empty()
+
+
+def test_compute_payment_plan_non_amortizing_partial():
+    loan = FixedRateLoan(
+        vendor="TestBank",
+        current_amount=Decimal("130.00"),
+        principal=Decimal("100.00"),
+        annual_interest_rate=0.12,
+        monthly_payment=Decimal("1.00"),
+    )
+
+    payment_plan = loan.compute_payment_plan(max_term_months=5, allow_partial=True)
+
+    assert payment_plan.height == 5
+    assert payment_plan.schema == PAYMENT_PLAN_SCHEMA
+
+
+def test_compute_payment_plan_max_term_exceeded_raises_with_partial_plan():
+    loan = FixedRateLoan(
+        vendor="TestBank",
+        current_amount=Decimal("130.00"),
+        principal=Decimal("100.00"),
+        annual_interest_rate=0.12,
+        monthly_payment=Decimal("50.00"),
+    )
+
+    with pytest.raises(MaxTermExceededError) as exc_info:
+        loan.compute_payment_plan(max_term_months=2)
+
+    # 3 months are required to pay off, see test_get_total_payment_req_n_month_payoff
+    assert exc_info.value.partial_plan["Month"].to_list() == [1, 2]
+    assert loan.compute_payment_plan(max_term_months=3).height == 3
+
+
+def test_daily_accrual_requires_as_of_date():
+    with pytest.raises(ValueError):
+        FixedRateLoan(
+            vendor="TestBank",
+            current_amount=Decimal("10000.00"),
+            principal=Decimal("10000.00"),
+            annual_interest_rate=0.0365,
+            monthly_payment=Decimal("500.00"),
+            accrual_convention=AccrualConvention.DAILY_ACTUAL_365,
+        )
+
+
+def test_after_monthly_interest_accum_daily_actual_365():
+    loan = FixedRateLoan(
+        vendor="TestBank",
+        current_amount=Decimal("10000.00"),
+        principal=Decimal("10000.00"),
+        annual_interest_rate=0.0365,
+        monthly_payment=Decimal("500.00"),
+        accrual_convention=AccrualConvention.DAILY_ACTUAL_365,
+        as_of_date=date(2021, 2, 1),
+    )
+
+    after_feb = loan.after_monthly_interest_accum()
+    after_mar = after_feb.after_monthly_interest_accum()
+
+    # 1 dollar a day on 10000 at 3.65% => 28 for Feb and 31 for Mar
+    assert after_feb.as_of_date == date(2021, 3, 1)
+    assert after_feb.interest == Decimal("28.00")
+    assert after_mar.interest == Decimal("59.00")
+
+
+def test_get_total_payment_req_daily_actual_360():
+    loan = FixedRateLoan(
+        vendor="TestBank",
+        current_amount=Decimal("130.00"),
+        principal=Decimal("100.00"),
+        annual_interest_rate=0.12,
+        monthly_payment=Decimal("50.00"),
+        accrual_convention=AccrualConvention.DAILY_ACTUAL_360,
+        as_of_date=date(2021, 1, 1),
+    )
+    # 100 * .12 * 31 / 360 = 1.03 interest => 81.03 remaining (50 paid)
+    # 81.03 * .12 * 28 / 360 = .76 interest => 31.79 remaining (50 paid)
+    # 31.79 * .12 * 31 / 360 = .33 interest => no remaining (32.12 paid)
+
+    assert loan.get_remaining_total_payment_req() == Decimal("132.12")
+
+
+def test_compute_payment_plan_daily_accrual_pays_off_when_payment_covers_average_month_only():
+    loan = FixedRateLoan(
+        vendor="TestBank",
+        current_amount=Decimal("300000.00"),
+        principal=Decimal("300000.00"),
+        annual_interest_rate=0.07,
+        monthly_payment=Decimal("1780.00"),
+        accrual_convention=AccrualConvention.DAILY_ACTUAL_365,
+        as_of_date=date(2021, 1, 1),
+    )
+
+    # 31 day months accrue 1783.56 which the payment does not cover, but the average month accrues 1750.00
+    assert loan.get_monthly_interest_accrual() == Decimal("1783.56")
+    assert loan.get_annual_interest_accrual() == Decimal("21000.00")
+    assert not loan.is_non_amortizing
+    payment_plan = loan.compute_payment_plan(max_term_months=800)
+    assert payment_plan.height == 707
+    assert payment_plan["Total Remaining"][-1] == C.ZERO_DOLLARS_DECIMAL
+
+
+def test_compute_payment_plan_daily_accrual_non_amortizing_over_a_year_raises():
+    loan = FixedRateLoan(
+        vendor="TestBank",
+        current_amount=Decimal("10000.00"),
+        principal=Decimal("10000.00"),
+        annual_interest_rate=0.0365,
+        monthly_payment=Decimal("30.41"),
+        accrual_convention=AccrualConvention.DAILY_ACTUAL_365,
+        as_of_date=date(2021, 2, 1),
+    )
+
+    # 1 dollar a day => 365.00 over the year, 12 * 30.41 = 364.92
+    with pytest.raises(NonAmortizingLoanError):
+        loan.compute_payment_plan()
@@ -0,0 +1,100 @@
+from decimal import Decimal
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from loans_sim.liabilities.loans.fixed_rate_loan import FixedRateLoan
+from loans_sim.liabilities.loans.loan_book import (
+    LOAN_BOOK_ERROR_SCHEMA,
+    LOAN_BOOK_SCHEMA,
+    read_loan_book,
+    validate_loan_book,
+)
+
+LOAN_BOOK_CSV = """vendor,current_amount,principal,annual_interest_rate,monthly_payment
+TestBank,130.00,100.00,0.12,50
+,130,100,0.12,50
+TestBank,-1,100.004,0.12,1.00
+TestBank,abc,100,0.12,50
+TestBank,0,0,0.12,0
+TestBank,130,100.00000000001,0.12,50
+"""
+
+
+@pytest.fixture
+def loan_book_csv(tmp_path: Path) -> Path:
+    path = tmp_path / "loan_book.csv"
+    path.write_text(LOAN_BOOK_CSV)
+    return path
+
+
+def test_read_loan_book_csv_valid_rows(loan_book_csv: Path):
+    res = read_loan_book(loan_book_csv)
+
+    assert not res.is_valid
+    assert res.loans.schema == LOAN_BOOK_SCHEMA
+    assert res.loans["Row"].to_list() == [0, 4]
+    assert res.loans["lifetime_payments"].to_list() == [Decimal("0.00"), Decimal("0.00")]
+
+
+def test_read_loan_book_csv_error_report(loan_book_csv: Path):
+    res = read_loan_book(loan_book_csv)
+
+    assert res.errors.schema == LOAN_BOOK_ERROR_SCHEMA
+    assert res.errors.select("Row", "Column").rows() == [
+        (1, "vendor"),
+        (2, "current_amount"),
+        (2, "principal"),  # 100.004 has a fraction of a cent
+        # 1.00 interest accrual on the 100.00 principal is not exceeded by the 1.00 payment
+        (2, "monthly_payment"),
+        (3, "current_amount"),  # unparseable amount is reported once rather than in every check that uses it
+        (5, "principal"),  # the fraction of a cent is past the scale amounts are parsed at
+    ]
+
+
+def test_loan_book_rows_match_models(loan_book_csv: Path):
+    res = read_loan_book(loan_book_csv)
+
+    loans = res.to_fixed_rate_loans()
+
+    assert loans[0] == FixedRateLoan(
+        vendor="TestBank",
+        current_amount=Decimal("130.00"),
+        principal=Decimal("100.00"),
+        annual_interest_rate=0.12,
+        monthly_payment=Decimal("50.00"),
+    )
+    assert loans[0].get_remaining_total_payment_req() == Decimal("132.13")
+    assert loans[1].is_paid_off
+
+
+def test_read_loan_book_parquet(tmp_path: Path):
+    path = tmp_path / "loan_book.parquet"
+    pl.DataFrame(
+        {
+            "vendor": ["TestBank", "TestBank"],
+            "current_amount": [130.01, 130.005],
+            "principal": [100.0, 100.0],
+            "annual_interest_rate": [0.12, 0.12],
+            "monthly_payment": [50.0, 50.0],
+            "lifetime_payments": [200.0, 200.0],
+        }
+    ).write_parquet(path)
+
+    res = read_loan_book(path)
+
+    assert res.loans.select("current_amount", "lifetime_payments").rows() == [(Decimal("130.01"), Decimal("200.00"))]
+    assert res.errors.select("Row", "Column", "Error").rows() == [
+        (1, "current_amount", "current_amount must not have fractions of a cent")
+    ]
+
+
+def test_validate_loan_book_missing_columns_raises():
+    with pytest.raises(ValueError):
+        validate_loan_book(pl.DataFrame({"vendor": ["TestBank"]}))
+
+
+def test_read_loan_book_unsupported_file_type_raises(tmp_path: Path):
+    with pytest.raises(ValueError):
+        read_loan_book(tmp_path / "loan_book.json")
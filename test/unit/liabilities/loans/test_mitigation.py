@@ -1,7 +1,9 @@
 # TODO: come back and beef up tests
 from decimal import Decimal
 
-from loans_sim.liabilities.loans.fixed_rate_loan import FixedRateLoan
+import pytest
+
+from loans_sim.liabilities.loans.fixed_rate_loan import FixedRateLoan, NonAmortizingLoanError
 from loans_sim.liabilities.loans.mitigation import (
     MAKE_ADDITIONAL_PAYMENT_ACTION_STR,
     simulate_savings_from_additional_payment,
@@ -47,3 +49,16 @@ def test_simulate_savings_from_additional_pay_partial_vs_over_n_months():
 
     assert savings_info.action == MAKE_ADDITIONAL_PAYMENT_ACTION_STR
     assert savings_info.lifetime_amount_saved == Decimal("1.00")
+
+
+def test_simulate_savings_from_additional_payment_non_amortizing_raises():
+    non_amortizing_loan = FixedRateLoan(
+        vendor="TestBank",
+        current_amount=Decimal("130.00"),
+        principal=Decimal("100.00"),
+        annual_interest_rate=0.12,
+        monthly_payment=Decimal("1.00"),
+    )
+
+    with pytest.raises(NonAmortizingLoanError):
+        simulate_savings_from_additional_payment(non_amortizing_loan, Decimal("10.00"))
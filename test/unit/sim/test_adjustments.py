@@ -0,0 +1,157 @@
+from datetime import date
+from decimal import Decimal
+
+import polars as pl
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from loans_sim.liabilities.loans.fixed_rate_loan import FixedRateLoan
+from loans_sim.liabilities.loans.mitigation import simulate_savings_from_additional_payment
+from loans_sim.sim.adjustments import (
+    ADJUSTED_COMPARISON_SCHEMA,
+    ADJUSTED_PAYMENT_PLAN_SCHEMA,
+    AdjustmentAssumptions,
+    adjust_asset_time_series,
+    adjust_payment_plan,
+    make_adjusted_comparison_frame,
+    make_deflator_frame,
+    make_real_loan_savings_frame,
+)
+from loans_sim.sim.time_series import AccumTimeSeries
+
+
+def _make_loan() -> FixedRateLoan:
+    return FixedRateLoan(
+        vendor="TestBank",
+        current_amount=Decimal("130.00"),
+        principal=Decimal("100.00"),
+        annual_interest_rate=0.12,
+        monthly_payment=Decimal("50.00"),
+    )
+
+
+def _make_asset_time_series() -> AccumTimeSeries:
+    return AccumTimeSeries(
+        label="test",
+        time_points=[date(2020, 1, 1), date(2020, 2, 1), date(2020, 3, 1)],
+        value_points=[Decimal("0.00"), Decimal("1.00"), Decimal("2.01")],
+    )
+
+
+def test_deflator_frame_flat_rate():
+    deflators = make_deflator_frame(AdjustmentAssumptions(annual_inflation_rate=0.12), num_months=2)
+
+    assert deflators["Month"].to_list() == [0, 1, 2]
+    assert deflators["Deflator"].to_list() == pytest.approx([1.0, 1.01, 1.0201])
+
+
+def test_deflator_frame_explicit_series_last_rate_carried_forward():
+    assumptions = AdjustmentAssumptions(annual_inflation_rate=0.5, monthly_inflation_rates=[0.1, 0.0])
+
+    deflators = make_deflator_frame(assumptions, num_months=4)
+
+    assert deflators["Deflator"].to_list() == pytest.approx([1.0, 1.1, 1.1, 1.1, 1.1])
+
+
+def test_adjust_payment_plan_nominal_matches_plan():
+    payment_plan = _make_loan().compute_payment_plan()
+
+    adjusted = adjust_payment_plan(payment_plan, AdjustmentAssumptions())
+
+    assert adjusted.schema == ADJUSTED_PAYMENT_PLAN_SCHEMA
+    assert adjusted["Monthly Interest Deduction"].to_list() == [0.0, 0.0, 0.0]
+    assert adjusted["Cum Real Net Cost"].to_list() == pytest.approx(
+        payment_plan["Cum Total Paid"].cast(pl.Float64).to_list()
+    )
+
+
+def test_adjust_payment_plan_deduction_and_inflation():
+    payment_plan = _make_loan().compute_payment_plan()
+    # interest paid by month from the plan is 31, .81, .32
+    assumptions = AdjustmentAssumptions(annual_inflation_rate=0.12, loan_interest_deduction_rate=0.5)
+
+    adjusted = adjust_payment_plan(payment_plan, assumptions)
+
+    assert adjusted["Monthly Interest Deduction"].to_list() == pytest.approx([15.5, 0.405, 0.16])
+    assert adjusted["Real Monthly Net Cost"].to_list() == pytest.approx(
+        [(50 - 15.5) / 1.01, (50 - 0.405) / 1.0201, (32.13 - 0.16) / 1.030301]
+    )
+
+
+def test_adjust_asset_time_series_tax_and_inflation():
+    asset_frame = _make_asset_time_series().to_frame()
+    assumptions = AdjustmentAssumptions(annual_inflation_rate=0.12, yield_tax_rate=0.5)
+
+    adjusted = adjust_asset_time_series(asset_frame, Decimal("100.00"), assumptions)
+
+    assert adjusted["After Tax Value"].to_list() == pytest.approx([0.0, 0.5, 1.005])
+    assert adjusted["Real Value"].to_list() == pytest.approx([0.0, 100.5 / 1.01 - 100, 101.005 / 1.0201 - 100])
+
+
+def test_real_loan_savings_nominal_matches_lifetime_amount_saved():
+    loan = _make_loan()
+    payment = Decimal("49.00")
+    after_payment = loan.make_payment(payment)
+
+    savings = make_real_loan_savings_frame(
+        loan.compute_payment_plan(),
+        after_payment.loan_status.compute_payment_plan(),
+        after_payment.payment_info,
+        AdjustmentAssumptions(),
+        num_months=5,
+    )
+    expected = simulate_savings_from_additional_payment(loan, payment).lifetime_amount_saved
+
+    assert savings["Month"].to_list() == [0, 1, 2, 3, 4, 5]
+    assert savings["Loan Real Savings"][0] == pytest.approx(0.0)
+    assert savings["Loan Real Savings"][-1] == pytest.approx(float(expected))
+
+
+def test_adjusted_comparison_frame_starts_even():
+    loan = _make_loan()
+    after_payment = loan.make_payment(Decimal("100.00"))
+
+    comparison = make_adjusted_comparison_frame(
+        _make_asset_time_series().to_frame(),
+        Decimal("100.00"),
+        loan.compute_payment_plan(),
+        after_payment.loan_status.compute_payment_plan(),
+        after_payment.payment_info,
+        AdjustmentAssumptions(),
+    )
+
+    assert comparison.schema == ADJUSTED_COMPARISON_SCHEMA
+    assert comparison["Month"].to_list() == [0, 1, 2]
+    assert comparison.row(0, named=True)["Loan Real Savings"] == pytest.approx(0.0)
+    assert comparison.row(0, named=True)["Real Differential"] == pytest.approx(0.0)
+
+
+def test_adjusted_comparison_frame_zero_apy_favors_paying_down_loan():
+    capital = Decimal("8000.00")
+    loan = FixedRateLoan(
+        vendor="TestBank",
+        current_amount=Decimal("20000.00"),
+        principal=Decimal("18000.00"),
+        annual_interest_rate=0.08,
+        monthly_payment=Decimal("600.00"),
+    )
+    after_payment = loan.make_payment(capital)
+    zero_apy_series = AccumTimeSeries(
+        label="test",
+        time_points=[date(2020, 1, 1) + relativedelta(months=i) for i in range(61)],
+        value_points=[Decimal("0.00")] * 61,
+    )
+
+    comparison = make_adjusted_comparison_frame(
+        zero_apy_series.to_frame(),
+        capital,
+        loan.compute_payment_plan(),
+        after_payment.loan_status.compute_payment_plan(),
+        after_payment.payment_info,
+        AdjustmentAssumptions(),
+    )
+    differentials = comparison["Real Differential"].to_list()
+
+    assert differentials[0] == pytest.approx(0.0)
+    # every month after the payment the loan has avoided interest while the savings account has earned nothing
+    assert all(differential < 0 for differential in differentials[1:])
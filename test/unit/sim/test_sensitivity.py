@@ -0,0 +1,111 @@
+from datetime import date
+from decimal import Decimal
+
+import polars as pl
+import pytest
+
+from loans_sim.assets.savings_account.high_yield import HighYieldSavingsAccount
+from loans_sim.liabilities.loans.fixed_rate_loan import FixedRateLoan
+from loans_sim.sim.sensitivity import (
+    IMPACT_SCHEMA,
+    INVEST_DECISION_STR,
+    PAY_DOWN_LOAN_DECISION_STR,
+    SensitivityScenario,
+    run_sensitivity_analysis,
+)
+
+
+def _make_scenario(apy: float = 0.035) -> SensitivityScenario:
+    return SensitivityScenario(
+        loan=FixedRateLoan(
+            vendor="TestBank",
+            current_amount=Decimal("20000.00"),
+            principal=Decimal("18000.00"),
+            annual_interest_rate=0.08,
+            monthly_payment=Decimal("600.00"),
+        ),
+        savings_account=HighYieldSavingsAccount(as_of_date=date(2020, 1, 1), vendor="TestBank", apy=apy),
+        capital=Decimal("8000.00"),
+        num_months=120,
+    )
+
+
+def test_sensitivity_perturbed_scenario_matches_base_evaluation():
+    apy_offset = 0.005
+    res = run_sensitivity_analysis(_make_scenario(), {"apy": (-apy_offset, apy_offset)})
+    high_apy_res = run_sensitivity_analysis(_make_scenario(apy=0.035 + apy_offset), {})
+
+    high_outcome = res.scenario_outcomes.filter(pl.col("Direction") == "High")["Real Differential"].item()
+
+    assert high_apy_res.impact.is_empty()
+    assert high_outcome == pytest.approx(high_apy_res.base_differential)
+
+
+def test_sensitivity_impact_ranked_by_swing():
+    param_ranges = {
+        "monthly_payment": (-50, 50),
+        "apy": (-0.005, 0.005),
+        "annual_interest_rate": (-0.01, 0.01),
+        "capital": (-1000, 1000),
+    }
+
+    res = run_sensitivity_analysis(_make_scenario(), param_ranges)
+
+    assert res.impact.schema == IMPACT_SCHEMA
+    assert res.scenario_outcomes.height == 2 * len(param_ranges)
+    assert res.impact["Swing"].to_list() == sorted(res.impact["Swing"].to_list(), reverse=True)
+    assert res.impact["Parameter"][0] == "apy"
+
+
+def test_sensitivity_elasticity_signs():
+    res = run_sensitivity_analysis(_make_scenario(), {"apy": (-0.005, 0.005), "annual_interest_rate": (-0.01, 0.01)})
+    elasticities = dict(zip(res.impact["Parameter"], res.impact["Elasticity"]))
+
+    # higher yield favors the savings account, a higher loan rate favors paying down the loan
+    assert elasticities["apy"] > 0
+    assert elasticities["annual_interest_rate"] < 0
+
+
+def test_sensitivity_decision_change_detected():
+    # at 0 apy the loan is favored, at 10% the savings account is
+    res = run_sensitivity_analysis(_make_scenario(apy=0.0), {"apy": (0.0, 0.1)})
+    impact_row = res.impact.row(0, named=True)
+
+    assert impact_row["Low Decision"] == PAY_DOWN_LOAN_DECISION_STR
+    assert impact_row["High Decision"] == INVEST_DECISION_STR
+    assert impact_row["Decision Changes"] is True
+    assert impact_row["Elasticity"] is None  # base apy of 0
+
+
+def test_sensitivity_unknown_parameter_raises():
+    with pytest.raises(ValueError):
+        run_sensitivity_analysis(_make_scenario(), {"not_a_param": (-1, 1)})
+
+
+def test_sensitivity_zero_apy_favors_paying_down_loan():
+    res = run_sensitivity_analysis(_make_scenario(apy=0.0), {"annual_interest_rate": (-0.01, 0.01)})
+    impact_row = res.impact.row(0, named=True)
+
+    assert res.base_differential < 0
+    assert impact_row["Low Decision"] == PAY_DOWN_LOAN_DECISION_STR
+    assert impact_row["High Decision"] == PAY_DOWN_LOAN_DECISION_STR
+
+
+def test_sensitivity_unpayable_perturbation_recorded_not_raised():
+    # 600 - 500 = 100 does not cover the 120 monthly interest accrual on 18000 at 8%
+    res = run_sensitivity_analysis(_make_scenario(), {"monthly_payment": (-500, 50), "apy": (-0.005, 0.005)})
+    outcomes = res.scenario_outcomes.filter(pl.col("Parameter") == "monthly_payment")
+
+    assert outcomes["Real Differential"].to_list()[0] is None
+    assert "never paid off" in outcomes["Error"].to_list()[0]
+    assert outcomes["Real Differential"].to_list()[1] is not None
+    assert res.scenario_outcomes.filter(pl.col("Parameter") == "apy")["Error"].null_count() == 2
+    assert res.impact["Parameter"].to_list() == ["apy", "monthly_payment"]  # null swing ranked last
+    # the failed low side has no decision, the evaluated high side does not change it
+    assert res.impact.filter(pl.col("Parameter") == "monthly_payment")["Decision Changes"].item() is False
+
+
+@pytest.mark.parametrize("param_ranges", [{"apy": (-0.05, 0.005)}, {"capital": (-9000, 1000)}])
+def test_sensitivity_negative_perturbed_value_raises(param_ranges: dict):
+    with pytest.raises(ValueError):
+        run_sensitivity_analysis(_make_scenario(), param_ranges)
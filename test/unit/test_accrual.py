@@ -0,0 +1,43 @@
+from datetime import date
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from loans_sim.accrual import (
+    AccrualConvention,
+    get_daily_rate_from_apy,
+    get_monthly_period_dates,
+    get_monthly_period_day_counts,
+    get_period_rate,
+)
+
+
+def test_daily_rate_from_apy_compounds_to_apy():
+    assert (1 + get_daily_rate_from_apy(0.035)) ** 365 == pytest.approx(1.035)
+
+
+@pytest.mark.parametrize(
+    "convention, expected",
+    [
+        (AccrualConvention.MONTHLY_SIMPLE, 0.01),
+        (AccrualConvention.DAILY_ACTUAL_365, 0.12 * 31 / 365),
+        (AccrualConvention.DAILY_ACTUAL_360, 0.12 * 31 / 360),
+        (AccrualConvention.DAILY_COMPOUNDED_APY, 1.12 ** (31 / 365) - 1),
+    ],
+)
+def test_get_period_rate_january(convention: AccrualConvention, expected: float):
+    assert get_period_rate(convention, 0.12, date(2020, 1, 1), date(2020, 2, 1)) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("start", [date(2020, 1, 1), date(2024, 1, 31), date(2023, 1, 30), date(2023, 12, 15)])
+def test_monthly_period_dates_match_stepping_one_month_at_a_time(start: date):
+    expected = [start]
+    for _ in range(60):
+        expected.append(expected[-1] + relativedelta(months=1))
+
+    assert list(get_monthly_period_dates(start, 60)) == expected
+
+
+def test_monthly_period_day_counts_leap_year_end_of_month():
+    # Jan 31 -> Feb 29 -> Mar 29 -> Apr 29 -> May 29
+    assert get_monthly_period_day_counts(date(2024, 1, 31), 4) == (29, 29, 31, 30)